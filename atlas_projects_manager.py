@@ -8,12 +8,19 @@ in your Atlas organization using a modern terminal UI built with Textual.
 """
 
 import os
-import json
-from datetime import datetime
-from typing import List, Dict, Any, Optional
+import sys
+import asyncio
+import contextlib
+import math
+import time
+import random
+from collections import deque
+from typing import List, Dict, Any, Optional, Generic, TypeVar
 
 from anyio import sleep
+import ciso8601
 import httpx
+import msgspec
 from dotenv import load_dotenv
 from textual.app import App, ComposeResult
 from textual.containers import Container, Vertical, Horizontal, VerticalScroll
@@ -27,133 +34,351 @@ from textual import on
 # Load environment variables
 load_dotenv()
 
-class ProjectData:
+T = TypeVar("T")
+
+
+class ProjectData(msgspec.Struct, rename={
+    'org_id': 'orgId',
+    'cluster_count': 'clusterCount',
+}):
     """Data model for Atlas projects."""
     
-    def __init__(self, project_data: Dict[str, Any]):
-        self.id = project_data.get('id', '')
-        self.name = project_data.get('name', '')
-        self.org_id = project_data.get('orgId', '')
-        self.created = project_data.get('created', '')
-        self.cluster_count = project_data.get('clusterCount', 0)
-        self.links = project_data.get('links', [])
+    id: str = ''
+    name: str = ''
+    org_id: str = ''
+    created: str = ''
+    cluster_count: int = 0
+    links: List[Dict[str, Any]] = []
+    created_display: str = 'N/A'
+    
+    def __post_init__(self):
+        # Format the created date once instead of on every table refresh
+        if self.created:
+            try:
+                dt = ciso8601.parse_datetime(self.created)
+                self.created_display = dt.strftime('%d-%b-%Y %H:%M')
+            except ValueError:
+                self.created_display = self.created[:19]  # Take first 19 chars
+
+
+class ProviderSettings(msgspec.Struct, rename={
+    'provider_name': 'providerName',
+    'region_name': 'regionName',
+    'instance_size_name': 'instanceSizeName',
+}):
+    """Cloud provider settings for an Atlas cluster."""
+    
+    provider_name: str = 'Unknown'
+    region_name: str = 'Unknown'
+    instance_size_name: str = 'Unknown'
+
+
+class ClusterData(msgspec.Struct, rename={
+    'connection_strings': 'connectionStrings',
+    'cluster_type': 'clusterType',
+    'mongo_db_version': 'mongoDBVersion',
+    'state_name': 'stateName',
+    'created_date': 'createDate',
+    'provider_settings': 'providerSettings',
+    'backup_enabled': 'backupEnabled',
+    'encryption_at_rest_provider': 'encryptionAtRestProvider',
+}):
+    """Data model for Atlas clusters."""
+    
+    id: str = ''
+    name: str = ''
+    connection_strings: Dict[str, Any] = {}
+    cluster_type: str = ''
+    mongo_db_version: str = ''
+    state_name: str = ''
+    created_date: str = ''
+    provider_settings: Optional[ProviderSettings] = None
+    backup_enabled: bool = False
+    encryption_at_rest_provider: str = ''
+    
+    # Extract provider and region info
+    @property
+    def provider_name(self) -> str:
+        return self.provider_settings.provider_name if self.provider_settings else 'Unknown'
+    
+    @property
+    def region_name(self) -> str:
+        return self.provider_settings.region_name if self.provider_settings else 'Unknown'
+    
+    @property
+    def instance_size_name(self) -> str:
+        return self.provider_settings.instance_size_name if self.provider_settings else 'Unknown'
 
 
-class ClusterData:
-    """Data model for Atlas clusters."""
+class _Envelope(msgspec.Struct, Generic[T], rename={'total_count': 'totalCount'}):
+    """Paginated list response returned by the Atlas API."""
     
-    def __init__(self, cluster_data: Dict[str, Any]):
-        self.id = cluster_data.get('id', '')
-        self.name = cluster_data.get('name', '')
-        self.connection_strings = cluster_data.get('connectionStrings', {})
-        self.cluster_type = cluster_data.get('clusterType', '')
-        self.mongo_db_version = cluster_data.get('mongoDBVersion', '')
-        self.state_name = cluster_data.get('stateName', '')
-        self.created_date = cluster_data.get('createDate', '')
-        self.provider_settings = cluster_data.get('providerSettings', {})
-        self.backup_enabled = cluster_data.get('backupEnabled', False)
-        self.encryption_at_rest_provider = cluster_data.get('encryptionAtRestProvider', '')
-        
-        # Extract provider and region info
-        if self.provider_settings:
-            self.provider_name = self.provider_settings.get('providerName', 'Unknown')
-            self.region_name = self.provider_settings.get('regionName', 'Unknown')
-            self.instance_size_name = self.provider_settings.get('instanceSizeName', 'Unknown')
-        else:
-            self.provider_name = 'Unknown'
-            self.region_name = 'Unknown'
-            self.instance_size_name = 'Unknown'
+    results: List[T] = []
+    total_count: int = 0
+
+
+# Decoders are built once and turn response bytes straight into typed objects
+_PROJECTS_DECODER = msgspec.json.Decoder(_Envelope[ProjectData])
+_CLUSTERS_DECODER = msgspec.json.Decoder(_Envelope[ClusterData])
+
+
+class RateLimiter:
+    """Sliding-window rate limiter that waits with asyncio.sleep."""
+    
+    def __init__(self, max_requests: int, burst_period: float):
+        self.max_requests = max_requests
+        self.burst_period = burst_period
+        self._requests: deque[float] = deque()
+        self._lock = asyncio.Lock()
+    
+    async def acquire(self) -> None:
+        """Wait until a request slot is available within the current window."""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                # Drop timestamps that have fallen out of the window
+                while self._requests and now - self._requests[0] >= self.burst_period:
+                    self._requests.popleft()
+                
+                if len(self._requests) < self.max_requests:
+                    break
+                
+                # Never block the event loop with time.sleep here
+                await asyncio.sleep(self.burst_period - (now - self._requests[0]))
+            
+            self._requests.append(time.monotonic())
+
+
+ATLAS_BASE_URL = "https://cloud.mongodb.com/api/atlas/v2"
+ATLAS_HEADERS = {
+    "Accept": "application/vnd.atlas.2023-01-01+json",
+    "Content-Type": "application/json"
+}
+
+# HTTP client shared by every AtlasAPI instance so the connection pool,
+# TLS sessions and HTTP/2 connections live for the whole app lifetime
+_CLIENT: Optional[httpx.AsyncClient] = None
+
+
+def _get_client() -> httpx.AsyncClient:
+    """Return the shared HTTP client, creating it on first use."""
+    global _CLIENT
+    if _CLIENT is None or _CLIENT.is_closed:
+        _CLIENT = httpx.AsyncClient(
+            timeout=httpx.Timeout(30.0, connect=5.0),
+            limits=httpx.Limits(
+                max_keepalive_connections=10,
+                max_connections=20,
+                # Bound connection lifetime so stale DNS entries are not kept
+                keepalive_expiry=60.0,
+            ),
+            headers=ATLAS_HEADERS,
+            base_url=ATLAS_BASE_URL,
+            http2=True,
+        )
+    return _CLIENT
+
+
+async def close_client() -> None:
+    """Close the shared HTTP client."""
+    global _CLIENT
+    if _CLIENT is not None:
+        await _CLIENT.aclose()
+        _CLIENT = None
 
 
 class AtlasAPI:
     """MongoDB Atlas Administration API client."""
     
-    def __init__(self, public_key: str, private_key: str):
+    # Largest page size accepted by the Atlas list endpoints
+    PAGE_SIZE = 500
+    
+    # Status codes worth retrying: rate limiting and transient server errors
+    RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+    
+    def __init__(self, public_key: str, private_key: str, ttl_seconds: float = 30.0):
         self.public_key = public_key
         self.private_key = private_key
-        self.base_url = "https://cloud.mongodb.com/api/atlas/v2"
-        self.client = httpx.AsyncClient(timeout=30.0)
+        self.base_url = ATLAS_BASE_URL
+        
+        # Use HTTP Digest Authentication with API keys. A single DigestAuth
+        # instance remembers the server challenge, so only the first request
+        # pays the extra 401 round trip.
+        self._auth = httpx.DigestAuth(public_key, private_key)
+        self.client = _get_client()
+        
+        # Atlas allows 100 requests per minute; keep some headroom
+        self._limiter = RateLimiter(max_requests=90, burst_period=60.0)
+        
+        # In-memory response cache: key -> (timestamp, ETag, parsed result).
+        # Expired entries are kept so their ETag can be used to revalidate.
+        self._cache: Dict[str, tuple[float, Optional[str], Any]] = {}
+        self._ttl_seconds = ttl_seconds
+
+    def _cache_key(self, url: str, params: Optional[Dict[str, Any]] = None) -> str:
+        """Build a cache key from the URL and sorted query params."""
+        if not params:
+            return url
+        query = "&".join(f"{k}={params[k]}" for k in sorted(params))
+        return f"{url}?{query}"
+
+    def _cache_get(self, key: str) -> Optional[Any]:
+        """Return a cached result if it is still within the TTL window."""
+        entry = self._cache.get(key)
+        if entry is None:
+            return None
+        ts, _, result = entry
+        if time.monotonic() - ts < self._ttl_seconds:
+            return result
+        return None
+
+    def _cache_set(self, key: str, result: Any, etag: Optional[str] = None) -> None:
+        """Store a parsed result and its ETag in the cache."""
+        self._cache[key] = (time.monotonic(), etag, result)
+
+    @staticmethod
+    def _retry_after(response: httpx.Response) -> Optional[float]:
+        """Return the Retry-After delay in seconds, if the server sent one."""
+        value = response.headers.get("Retry-After")
+        if value is None:
+            return None
+        try:
+            return float(value)
+        except ValueError:
+            return None
+
+    async def _retry(self, coro_fn, *, retries: int = 4, base: float = 0.5) -> httpx.Response:
+        """Send a request, retrying transient failures with exponential backoff."""
+        for attempt in range(retries):
+            delay = None
+            try:
+                await self._limiter.acquire()
+                response = await coro_fn()
+                # 304 is the expected answer to a conditional GET, not an error
+                if response.status_code != httpx.codes.NOT_MODIFIED:
+                    response.raise_for_status()
+                return response
+            except httpx.HTTPStatusError as e:
+                if attempt == retries - 1 or e.response.status_code not in self.RETRY_STATUS_CODES:
+                    raise
+                delay = self._retry_after(e.response)
+            except httpx.TransportError:
+                if attempt == retries - 1:
+                    raise
+            
+            if delay is None:
+                delay = base * 2 ** attempt + random.random() * 0.1
+            # Back off without blocking the event loop
+            await asyncio.sleep(delay)
+        
+        raise RuntimeError("retries must be at least 1")
 
-    async def delete_one_project(self, project_id: str) -> bool:
-        """Delete a project from Atlas API."""
-        url = f"{self.base_url}/groups/{project_id}"
+    async def _get_all_pages(
+        self, url: str, decoder: msgspec.json.Decoder, etag: Optional[str] = None
+    ) -> tuple[Optional[List[Any]], Optional[str]]:
+        """Fetch every page of a list endpoint, requesting pages 2..N concurrently.
+        
+        Returns the results and the ETag to revalidate them with. If ``etag``
+        is given and the server answers 304 Not Modified, the results are None.
+        """
+        async def fetch_page(page_num: int, headers: Optional[Dict[str, str]] = None) -> httpx.Response:
+            params = {"itemsPerPage": self.PAGE_SIZE, "pageNum": page_num, "includeCount": "true"}
+            return await self._retry(
+                lambda: self.client.get(url, params=params, headers=headers, auth=self._auth)
+            )
+        
+        first_response = await fetch_page(1, {"If-None-Match": etag} if etag else None)
+        if first_response.status_code == httpx.codes.NOT_MODIFIED:
+            return None, etag
+        
+        first = decoder.decode(first_response.content)
+        results = list(first.results)
+        
+        n_pages = math.ceil(first.total_count / self.PAGE_SIZE)
+        if n_pages > 1:
+            try:
+                async with asyncio.TaskGroup() as tg:
+                    tasks = [tg.create_task(fetch_page(n)) for n in range(2, n_pages + 1)]
+            except ExceptionGroup as eg:
+                # Remaining pages are cancelled; surface the first failure
+                raise eg.exceptions[0]
+            for task in tasks:
+                results.extend(decoder.decode(task.result().content).results)
+        
+        # The first page's ETag only covers the whole result when there is one page
+        new_etag = first_response.headers.get("ETag") if n_pages <= 1 else None
+        return results, new_etag
+
+    async def warm_up(self) -> None:
+        """Open the connection and complete the Digest handshake ahead of time."""
+        try:
+            await self._limiter.acquire()
+            await self.client.get("/groups", params={"itemsPerPage": 1}, auth=self._auth)
+        except httpx.HTTPError:
+            # Best effort only; the real request will surface any error
+            pass
+
+    async def _request(self, method: str, path: str, decoder: Optional[msgspec.json.Decoder] = None) -> Any:
+        """Send a request to the Atlas API.
+        
+        GET requests with a decoder return every page of decoded results and
+        are served from the TTL cache when possible. Other requests return True.
+        """
+        key = self._cache_key(path)
+        entry = None
+        if method == "GET":
+            cached = self._cache_get(key)
+            if cached is not None:
+                return cached
+            entry = self._cache.get(key)
         
         try:
-            # Use HTTP Digest Authentication with API keys
-            auth = httpx.DigestAuth(self.public_key, self.private_key)
-            headers = {
-                "Accept": "application/vnd.atlas.2023-01-01+json",
-                "Content-Type": "application/json"
-            }
+            if decoder is None:
+                await self._retry(lambda: self.client.request(method, path, auth=self._auth))
+                return True
             
-            response = await self.client.delete(url, auth=auth, headers=headers)
-            response.raise_for_status()
+            # Revalidate an expired entry with its ETag instead of refetching
+            etag = entry[1] if entry else None
+            results, etag = await self._get_all_pages(path, decoder, etag)
         except httpx.HTTPError as e:
             raise Exception(f"API request failed: {e}")
-        except json.JSONDecodeError:
+        except msgspec.DecodeError:
             raise Exception("Invalid JSON response from API")
         
+        if results is None:
+            # Not modified: the cached result is still current
+            results = entry[2]
+        
+        if method == "GET":
+            self._cache_set(key, results, etag)
+        return results
+
+    async def delete_one_project(self, project_id: str) -> bool:
+        """Delete a project from Atlas API."""
+        await self._request("DELETE", f"/groups/{project_id}")
+        
+        # Invalidate cached project list so the refresh is authoritative
+        self._cache.pop(self._cache_key("/groups"), None)
+        self._cache.pop(self._cache_key(f"/groups/{project_id}/clusters"), None)
         return True
     
     async def get_projects(self) -> List[ProjectData]:
         """Fetch all projects from Atlas API."""
-        url = f"{self.base_url}/groups"
-        
-        try:
-            # Use HTTP Digest Authentication with API keys
-            auth = httpx.DigestAuth(self.public_key, self.private_key)
-            headers = {
-                "Accept": "application/vnd.atlas.2023-01-01+json",
-                "Content-Type": "application/json"
-            }
-            
-            response = await self.client.get(url, auth=auth, headers=headers)
-            response.raise_for_status()
-            
-            data = response.json()
-            projects = []
-            
-            for project_data in data.get('results', []):
-                projects.append(ProjectData(project_data))
-            
-            return projects
-            
-        except httpx.HTTPError as e:
-            raise Exception(f"API request failed: {e}")
-        except json.JSONDecodeError:
-            raise Exception("Invalid JSON response from API")
+        return await self._request("GET", "/groups", _PROJECTS_DECODER)
     
     async def get_clusters(self, project_id: str) -> List[ClusterData]:
         """Fetch all clusters for a specific project from Atlas API."""
-        url = f"{self.base_url}/groups/{project_id}/clusters"
-        
-        try:
-            # Use HTTP Digest Authentication with API keys
-            auth = httpx.DigestAuth(self.public_key, self.private_key)
-            headers = {
-                "Accept": "application/vnd.atlas.2023-01-01+json",
-                "Content-Type": "application/json"
-            }
-            
-            response = await self.client.get(url, auth=auth, headers=headers)
-            response.raise_for_status()
-            
-            data = response.json()
-            clusters = []
-            
-            for cluster_data in data.get('results', []):
-                clusters.append(ClusterData(cluster_data))
-            
-            return clusters
-            
-        except httpx.HTTPError as e:
-            raise Exception(f"API request failed: {e}")
-        except json.JSONDecodeError:
-            raise Exception("Invalid JSON response from API")
+        return await self._request("GET", f"/groups/{project_id}/clusters", _CLUSTERS_DECODER)
     
     async def close(self):
-        """Close the HTTP client."""
-        await self.client.aclose()
+        """Drop cached responses; the shared HTTP client is closed by close_client()."""
+        self._cache.clear()
+    
+    async def __aenter__(self) -> "AtlasAPI":
+        return self
+    
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
 
 
 class ProjectsTable(DataTable):
@@ -218,12 +443,14 @@ class ClusterViewScreen(Screen):
     async def on_mount(self) -> None:
         """Initialize the cluster view."""
         self.title = f"Clusters - {self.project_data.name}"
+        self._clusters_table = self.query_one("#clusters_table", ClustersTable)
+        self._status = self.query_one("#cluster_status_display", Static)
         await self.fetch_clusters()
     
     async def fetch_clusters(self) -> None:
         """Fetch clusters for the current project."""
         try:
-            await self.update_status("Loading clusters...")
+            self.update_status("Loading clusters...")
             
             # Fetch clusters
             clusters = await self.api_client.get_clusters(self.project_data.id)
@@ -233,18 +460,16 @@ class ClusterViewScreen(Screen):
             await self.update_clusters_table()
             
             count = len(clusters)
-            await self.update_status(f"Successfully loaded {count} cluster{'s' if count != 1 else ''}")
+            self.update_status(f"Successfully loaded {count} cluster{'s' if count != 1 else ''}")
             
         except Exception as e:
-            await self.update_status(f"Error loading clusters: {str(e)}")
+            self.update_status(f"Error loading clusters: {str(e)}")
     
     async def update_clusters_table(self) -> None:
         """Update the clusters table with fetched data."""
-        table = self.query_one("#clusters_table", ClustersTable)
-        table.clear()
-        
-        for cluster in self.clusters:
-            table.add_row(
+        table = self._clusters_table
+        rows = [
+            (
                 cluster.name or "Unnamed Cluster",
                 cluster.state_name or "Unknown",
                 cluster.provider_name,
@@ -252,11 +477,15 @@ class ClusterViewScreen(Screen):
                 cluster.instance_size_name,
                 cluster.mongo_db_version or "Unknown"
             )
+            for cluster in self.clusters
+        ]
+        
+        table.clear()
+        table.add_rows(rows)
     
-    async def update_status(self, message: str) -> None:
+    def update_status(self, message: str) -> None:
         """Update the status display."""
-        status_display = self.query_one("#cluster_status_display", Static)
-        status_display.update(message)
+        self._status.update(message)
     
     def action_back(self) -> None:
         """Go back to the projects view."""
@@ -290,6 +519,11 @@ class AtlasProjectsApp(App):
     def __init__(self):
         super().__init__()
         self.api_client: Optional[AtlasAPI] = None
+        self._warm_task: Optional[asyncio.Task] = None
+        self._prewarm_task: Optional[asyncio.Task] = None
+        self._rendered_rows: Dict[str, tuple] = {}
+        # Owns the lifetime of every AtlasAPI client the app opens
+        self._stack = contextlib.AsyncExitStack()
         self.public_key = os.getenv('ATLAS_PUBLIC_KEY', '')
         self.private_key = os.getenv('ATLAS_PRIVATE_KEY', '')
         self.org_id = os.getenv('ATLAS_ORG_ID', '')
@@ -311,10 +545,11 @@ class AtlasProjectsApp(App):
         
         yield Footer()
     
-    def on_mount(self) -> None:
+    async def on_mount(self) -> None:
         """Initialize the application."""
         self.title = "MongoDB Atlas Projects Manager"
-        
+        self._projects_table = self.query_one("#projects_table", ProjectsTable)
+        self._status = self.query_one("#status_display", Static)
 
         if not all([
             os.getenv('ATLAS_PUBLIC_KEY'),
@@ -324,18 +559,31 @@ class AtlasProjectsApp(App):
             self.update_status("Missing environment variables. Check .env file")
         else:
             self.update_status(f"Credentials loaded from environment variables", "success")
+            
+            # Establish the TLS session before the user presses "a"
+            self.api_client = await self._open_api_client(self.public_key, self.private_key)
+            self._prewarm_task = asyncio.create_task(self.api_client.warm_up())
+    
+    async def _open_api_client(self, public_key: str, private_key: str) -> AtlasAPI:
+        """Create an API client that is closed together with the app."""
+        return await self._stack.enter_async_context(AtlasAPI(public_key, private_key))
 
 
     async def fetch_projects(self, public_key: str, private_key: str) -> None:
         """Fetch projects from Atlas API."""
-        await self.update_status("Loading projects...", "")
+        self.update_status("Loading projects...", "")
         try:
-            # Close existing client if any
-            if self.api_client:
-                await self.api_client.close()
+            # Reuse the existing client (and its connection pool) unless the
+            # credentials changed
+            if self.api_client and (
+                self.api_client.public_key != public_key
+                or self.api_client.private_key != private_key
+            ):
+                await self._stack.aclose()
+                self.api_client = None
             
-            # Create new API client
-            self.api_client = AtlasAPI(public_key, private_key)
+            if self.api_client is None:
+                self.api_client = await self._open_api_client(public_key, private_key)
             
             # Fetch projects
             projects = await self.api_client.get_projects()
@@ -345,88 +593,120 @@ class AtlasProjectsApp(App):
             await self.update_projects_table()
             
             count = len(projects)
-            await self.update_status(f"Successfully loaded {count} project{'s' if count != 1 else ''}", "success")
+            self.update_status(f"Successfully loaded {count} project{'s' if count != 1 else ''}", "success")
+            
+            # Prefetch clusters in the background so cluster views open instantly
+            if self._warm_task:
+                self._warm_task.cancel()
+            self._warm_task = asyncio.create_task(self._warm_cluster_cache())
             
         except Exception as e:
-            await self.update_status(f"Error: {str(e)}", "error")
+            self.update_status(f"Error: {str(e)}", "error")
+    
+    async def _warm_cluster_cache(self) -> None:
+        """Fetch clusters for all loaded projects concurrently to fill the cache."""
+        api_client = self.api_client
+        if not api_client:
+            return
+        
+        # Bound the fan-out to stay well within Atlas rate limits
+        semaphore = asyncio.Semaphore(8)
+        
+        async def warm(project_id: str) -> None:
+            async with semaphore:
+                await api_client.get_clusters(project_id)
+        
+        try:
+            async with asyncio.TaskGroup() as tg:
+                for project in self.projects:
+                    tg.create_task(warm(project.id))
+        except* Exception:
+            # Prefetching is best effort; the cluster view fetches on demand
+            pass
     
     async def update_projects_table(self) -> None:
         """Update the projects table with fetched data."""
-        table = self.query_one("#projects_table", ProjectsTable)
-        table.clear()
+        table = self._projects_table
+        rows = {
+            project.id: (project.name or "Unnamed Project", project.id, project.created_display)
+            for project in self.projects
+        }
         
-        for project in self.projects:
-            # Format the created date
-            created_date = "N/A"
-            if project.created:
-                try:
-                    dt = datetime.fromisoformat(project.created.replace('Z', '+00:00'))
-                    created_date = dt.strftime('%d-%b-%Y %H:%M')
-                except:
-                    created_date = project.created[:19]  # Take first 19 chars
-            
-            table.add_row(
-                project.name or "Unnamed Project",
-                project.id,
-                created_date
-            )
+        # Only touch rows that changed since the last render; rows are keyed
+        # by project ID so they can be removed or updated in place
+        for project_id in self._rendered_rows.keys() - rows.keys():
+            table.remove_row(project_id)
+        
+        for project_id, row in rows.items():
+            rendered = self._rendered_rows.get(project_id)
+            if rendered is None:
+                table.add_row(*row, key=project_id)
+            elif rendered != row:
+                for column_key, value in zip(table.columns, row):
+                    table.update_cell(project_id, column_key, value)
+        
+        self._rendered_rows = rows
     
-    async def update_status(self, message: str, status_type: str = "") -> None:
+    def update_status(self, message: str, status_type: str = "") -> None:
         """Update the status display."""
-        status_display = self.query_one("#status_display", Static)
-        status_display.update(message)
+        self._status.update(message)
         
         # Update CSS classes based on status type
-        status_display.remove_class("error", "success")
+        self._status.remove_class("error", "success")
         if status_type:
-            status_display.add_class(status_type)
+            self._status.add_class(status_type)
     
-    async def on_exit(self) -> None:
+    async def on_unmount(self) -> None:
         """Clean up when exiting."""
-        if self.api_client:
-            await self.api_client.close()
+        if self._prewarm_task:
+            self._prewarm_task.cancel()
+        if self._warm_task:
+            self._warm_task.cancel()
+        await self._stack.aclose()
+        await close_client()
 
 
     async def action_quit(self):
         self.exit()
     
     async def action_delete(self):
-        table = self.query_one("#projects_table", DataTable)
+        table = self._projects_table
 
         if table.cursor_row is None or table.cursor_row < 0:
-            await self.update_status("Please select a project to delete")
+            self.update_status("Please select a project to delete")
             return
 
         try:
             # row_key = table.coordinate_to_cell_key(table.cursor_row)       
-            await self.update_status(f"Deleting project...{table.cursor_row}")     
+            self.update_status(f"Deleting project...{table.cursor_row}")     
             selected_row = table.get_row_at(table.cursor_row)
             project_name = selected_row[0]
             project_id = selected_row[1]
 
-            await self.update_status(f"Deleting project: {project_name} - {project_id}")
+            self.update_status(f"Deleting project: {project_name} - {project_id}")
 
-            self.api_client = AtlasAPI(self.public_key, self.private_key)
+            if self.api_client is None:
+                self.api_client = await self._open_api_client(self.public_key, self.private_key)
             await self.api_client.delete_one_project(project_id)
-            await self.update_status(f"Project deleted: {project_name} - {project_id}", "success")
+            self.update_status(f"Project deleted: {project_name} - {project_id}", "success")
             await self.fetch_projects(self.public_key, self.private_key)
 
         except (IndexError, StopIteration):
-            await self.update_status("Could not find selected project", "error")
+            self.update_status("Could not find selected project", "error")
 
 
     async def action_authenticate(self):
         """Authenticate with Azure"""
-        await self.update_status("Authenticating...")
+        self.update_status("Authenticating...")
         await self.fetch_projects(self.public_key, self.private_key)
 
     async def action_cluster(self):
         """View clusters for the selected project."""
 
-        table = self.query_one("#projects_table", DataTable)
+        table = self._projects_table
 
         if table.cursor_row is None or table.cursor_row < 0:
-            await self.update_status("Please select a project to view clusters")
+            self.update_status("Please select a project to view clusters")
             return
 
         try:
@@ -443,22 +723,22 @@ class AtlasProjectsApp(App):
 
             if selected_project:
                 
-                await self.update_status(f"Loading clusters for project: {project_name}")
+                self.update_status(f"Loading clusters for project: {project_name}")
                 await sleep (1)
 
                 # Create API client if not available
                 if not self.api_client:
-                    self.api_client = AtlasAPI(self.public_key, self.private_key)
+                    self.api_client = await self._open_api_client(self.public_key, self.private_key)
                 
                 # Push the cluster view screen
                 cluster_screen = ClusterViewScreen(selected_project, self.api_client)
                 self.push_screen(cluster_screen)
-                await self.update_status("")
+                self.update_status("")
             else:
-                await self.update_status("Could not find project data", "error")
+                self.update_status("Could not find project data", "error")
 
         except (IndexError, Exception) as e:
-            await self.update_status(f"Error viewing clusters: {str(e)}", "error")
+            self.update_status(f"Error viewing clusters: {str(e)}", "error")
 
     @on(DataTable.RowSelected)
     async def on_row_selected(self, event: DataTable.RowSelected) -> None:
@@ -466,13 +746,25 @@ class AtlasProjectsApp(App):
         if event.data_table.id == "projects_table":
             # Auto-open clusters when a project row is selected
             await self.action_cluster()
-            self.refresh_bindings()
+
+
+def _new_event_loop() -> Optional[asyncio.AbstractEventLoop]:
+    """Create a libuv-backed event loop (uvloop, or winloop on Windows) if installed."""
+    try:
+        if sys.platform == "win32":
+            import winloop as loop_impl
+        else:
+            import uvloop as loop_impl
+    except ImportError:
+        return None
+    return loop_impl.new_event_loop()
 
 
 def main():
     """Main entry point."""
     app = AtlasProjectsApp()
-    app.run()
+    # Falls back to the default asyncio loop when no uvloop is available
+    app.run(loop=_new_event_loop())
 
 
 if __name__ == "__main__":